@@ -1,8 +1,9 @@
 
 import typer
+import pandas as pd
 from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor
-from credit_spread_framework.indicators.factory import get_indicator_class
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from credit_spread_framework.indicators.factory import get_all_indicator_classes
 from credit_spread_framework.data.repositories.ohlcv_repository import load_bars_from_db
 from credit_spread_framework.data.repositories.indicator_value_repository import save_indicator_values_to_db
 from credit_spread_framework.data.repositories.indicator_repository import get_all_indicators
@@ -11,19 +12,37 @@ app = typer.Typer()
 
 TIMEFRAMES = ['1m', '3m', '15m', '1h', '1d']
 
-def run_enrich_for_indicator(indicator: str, timeframe: str, start: str, end: str, qualifier: str):
-    print(f"[INFO] Running enrichment for {indicator} on {timeframe} with qualifier '{qualifier}'...")
-    start_dt = datetime.fromisoformat(start).replace(tzinfo=timezone.utc) if start else None
-    end_dt = datetime.fromisoformat(end).replace(tzinfo=timezone.utc) if end else None
+# Bars for the timeframe a worker pool was started for. Set once per worker by the pool
+# initializer, so the frame is inherited (fork) or pickled once per worker (spawn)
+# instead of being pickled into every task.
+_bars = None
 
-    bars = load_bars_from_db(timeframe, start_dt, end_dt)
-    IndicatorClass, metadata = get_indicator_class(indicator)
+def _init_worker(bars: pd.DataFrame):
+    global _bars
+    _bars = bars
+
+def _drain_saves(saves: dict, max_pending: int) -> dict:
+    """
+    Raises the first failed save, blocking until at most max_pending saves are still
+    outstanding. Returns the saves that have not finished yet.
+    """
+    while True:
+        done = [save for save in saves if save.done()]
+        for save in done:
+            save.result()  # re-raises a failed write
+            del saves[save]
+        if len(saves) <= max_pending:
+            return saves
+        wait(saves, return_when=FIRST_COMPLETED)
+
+def run_enrich_for_indicator(indicator: str, IndicatorClass: type, metadata: dict, timeframe: str, qualifier: str):
+    print(f"[INFO] Running enrichment for {indicator} on {timeframe} with qualifier '{qualifier}'...")
     indicator_instance = IndicatorClass(
         parameters_json=metadata.get("ParametersJson") or {}, 
         qualifier=qualifier
     )
-    values = indicator_instance.calculate(bars)
-    save_indicator_values_to_db(values, indicator, timeframe, metadata)
+    # Compute only on the worker's timeframe bars; the parent's writer thread saves the result
+    return indicator_instance.calculate(_bars)
 
 @app.command()
 def enrich_data(
@@ -31,24 +50,66 @@ def enrich_data(
     timeframe: list[str] = typer.Option(None, "--timeframe", "-t", help="Timeframes (e.g. 1m 15m 1h)"),
     start: str = typer.Option(None, "--start", help="Start date (YYYY-MM-DD)"),
     end: str = typer.Option(None, "--end", help="End date (YYYY-MM-DD)"),
-    threads: int = typer.Option(4, "--threads", help="Number of threads to use"),
+    threads: int = typer.Option(4, "--threads", help="Number of worker processes to use"),
     qualifier: str = typer.Option(None, "--qualifier", "-q", help="Qualifier (e.g. 'time', 'linear', 'volume')")
 ):
-    indicators = indicator or get_all_indicators()
+    indicators = list(indicator or get_all_indicators())
     timeframes = timeframe or TIMEFRAMES
 
     print(f"[INFO] Indicators: {indicators}")
     print(f"[INFO] Timeframes: {timeframes}")
-    print(f"[INFO] Threads: {threads}")
-
-    with ThreadPoolExecutor(max_workers=threads) as executor:
-        futures = [
-            executor.submit(run_enrich_for_indicator, ind, tf, start, end, qualifier)
-            for ind in indicators
-            for tf in timeframes
-        ]
-        for future in futures:
-            future.result()
+    print(f"[INFO] Workers: {threads}")
+
+    # Resolve every indicator class with one query instead of one lookup per indicator per worker
+    indicator_classes = get_all_indicator_classes()
+    for ind in indicators:
+        if ind not in indicator_classes:
+            raise ValueError(f"[ERROR] Indicator '{ind}' not found or inactive in database.")
+
+    start_dt = datetime.fromisoformat(start).replace(tzinfo=timezone.utc) if start else None
+    end_dt = datetime.fromisoformat(end).replace(tzinfo=timezone.utc) if end else None
+
+    # Indicator math is CPU-bound, so fan out to processes rather than threads to
+    # sidestep the GIL. Timeframes run one at a time: bars are loaded once, handed to a
+    # fresh worker pool through its initializer and dropped before the next timeframe
+    # loads, so only one timeframe's bars and at most one timeframe's computed frames are
+    # in flight. Results go to a single writer thread so inserts overlap with the
+    # remaining computation; the writer backlog is capped at one timeframe's worth.
+    writer = ThreadPoolExecutor(max_workers=1)
+    saves = {}
+    try:
+        for tf in timeframes:
+            saves = _drain_saves(saves, len(indicators))
+            bars = load_bars_from_db(tf, start_dt, end_dt)
+            workers = min(threads, len(indicators))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(bars,)) as executor:
+                futures = {
+                    executor.submit(run_enrich_for_indicator, ind, *indicator_classes[ind], tf, qualifier): ind
+                    for ind in indicators
+                }
+                del bars
+
+                # Surface the first compute or save failure as soon as it happens and drop queued work
+                try:
+                    for future in as_completed(futures):
+                        ind = futures.pop(future)
+                        values = future.result()
+                        saves = _drain_saves(saves, len(indicators))
+                        saves[writer.submit(save_indicator_values_to_db, values, ind, tf, indicator_classes[ind][1])] = (ind, tf)
+                except Exception:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        _drain_saves(saves, 0)
+    except Exception as e:
+        # Drop queued saves (waits only for the one in progress) and report any that
+        # failed alongside the error being raised
+        writer.shutdown(cancel_futures=True)
+        for save, (ind, tf) in saves.items():
+            if not save.cancelled() and save.exception() not in (None, e):
+                print(f"[ERROR] Saving {ind} on {tf} failed: {save.exception()}")
+        raise
+    finally:
+        writer.shutdown()
 
 if __name__ == "__main__":
     app()
@@ -1,5 +1,6 @@
 from sqlalchemy import create_engine
 import os
+import threading
 import urllib
 from dotenv import load_dotenv
 
@@ -17,10 +18,41 @@ if not conn_str:
 
 conn_str_encoded = urllib.parse.quote_plus(conn_str)
 
-def get_engine():
-    return create_engine(
-        f"mssql+pyodbc:///?odbc_connect={conn_str_encoded}",
-        echo=False,
-        fast_executemany=True,
-        connect_args={"autocommit": True}
-    )
+# Pool sizing for threaded/process fan-out (enrich_data, resample_bars); override via .env
+POOL_SIZE = int(os.getenv("SQLSERVER_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(os.getenv("SQLSERVER_MAX_OVERFLOW", "10"))
+POOL_RECYCLE = int(os.getenv("SQLSERVER_POOL_RECYCLE", "3600"))
+
+# One engine (and connection pool) per process and connection string. Keyed by PID so a
+# worker forked from a parent that already connected never reuses the parent's pooled
+# connections.
+_engines = {}
+_engines_lock = threading.Lock()
+
+def get_engine(connection_string=None):
+    """
+    Returns the shared engine for the given ODBC connection string (defaults to the one
+    from .env). Engines are created once per process and reused on every later call.
+    """
+    odbc_connect = urllib.parse.quote_plus(connection_string) if connection_string else conn_str_encoded
+    key = (os.getpid(), odbc_connect)
+    engine = _engines.get(key)
+    if engine is not None:
+        return engine
+
+    # Writer threads may race on first use; only one of them builds the engine
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_engine(
+                f"mssql+pyodbc:///?odbc_connect={odbc_connect}",
+                echo=False,
+                fast_executemany=True,
+                pool_size=POOL_SIZE,
+                max_overflow=MAX_OVERFLOW,
+                pool_pre_ping=True,
+                pool_recycle=POOL_RECYCLE,
+                connect_args={"autocommit": True}
+            )
+            _engines[key] = engine
+    return engine
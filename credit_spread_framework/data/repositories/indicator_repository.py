@@ -1,13 +1,19 @@
 from credit_spread_framework.data.db_engine import get_engine
 # File: credit_spread_framework/data/repositories/indicator_repository.py
 
-import sqlalchemy as sa
-import urllib
+from functools import lru_cache
+from sqlalchemy import text
 
+_SELECT_ACTIVE_SHORT_NAMES = text("SELECT ShortName FROM indicators WHERE IsActive = 1")
+
+@lru_cache(maxsize=1)
 def get_all_indicators():
+    """
+    Returns the short names of all active indicators. The list is static for a CLI run,
+    so it is fetched once and cached; call get_all_indicators.cache_clear() to reload.
+    """
+    engine = get_engine()
+    with engine.connect() as conn:
+        indicators = tuple(conn.execute(_SELECT_ACTIVE_SHORT_NAMES).scalars().all())
 
-    with engine.begin() as conn:
-        result = conn.execute(text("SELECT ShortName FROM indicators"))
-        indicators = [row[0] for row in result]
-    
     return indicators
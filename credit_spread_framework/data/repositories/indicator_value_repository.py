@@ -10,46 +10,80 @@ create_engine = get_engine
 
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
+# Rows bound per executemany call; pyodbc's fast_executemany ships each chunk in one round trip
+INSERT_BATCH_SIZE = 1000
+
+# IndicatorId per (indicator_name, timeframe); metadata rows don't change during a run
+_indicator_ids = {}
+
+# Statements are built once at import rather than on every save
+_SELECT_INDICATOR_ID = text("SELECT IndicatorId FROM indicator_metadata WHERE Name = :name AND Timeframe = :timeframe")
+
+_INSERT_INDICATOR_VALUE = text("""
+    INSERT INTO indicator_values (BarId, Timeframe, IndicatorId, Value, TimestampStart)
+    VALUES (:bar_id, :timeframe, :indicator_id, :value, :timestamp_start)
+""")
+
 def save_indicator_values_to_db(values: pd.DataFrame, indicator_name: str, timeframe: str, metadata=None):
     """
-    Save indicator values to the database. Fetches the IndicatorId dynamically.
+    Save indicator values to the database. Fetches the IndicatorId dynamically
+    (per indicator and timeframe) and caches it for the rest of the process.
     """
-    # Create a new engine/connection (monkeypatchable via create_engine)
-    engine = create_engine(SQLSERVER_CONN_STRING)
-
     thread_name = current_thread().name
     day = values['timestamp_start'].iloc[0].date() if not values.empty else 'N/A'
-    print(f"[{thread_name}] {indicator_name} on {timeframe} | {day} | Start saving...")
 
-    insert_stmt = text("""
-        INSERT INTO indicator_values (BarId, Timeframe, IndicatorId, Value, TimestampStart)
-        VALUES (:bar_id, :timeframe, :indicator_id, :value, :timestamp_start)
-    """)
+    # Determine which column holds the value (e.g. 'value' or 'rsi')
+    value_col = 'value' if 'value' in values.columns else 'rsi'
+    if not values.empty:
+        # Drop NaN rows with one vectorized mask instead of a per-row isna check
+        values = values[values[value_col].notna()]
+    if values.empty:
+        # Nothing to insert: skip the connection and IndicatorId lookup entirely
+        print(f"[{thread_name}] {indicator_name} on {timeframe} | {day} | No values to save.")
+        return
+
+    # Shared per-process engine (monkeypatchable via create_engine)
+    engine = create_engine(SQLSERVER_CONN_STRING)
+
+    print(f"[{thread_name}] {indicator_name} on {timeframe} | {day} | Start saving...")
 
     with engine.begin() as conn:
-        # Fetch the numeric IndicatorId from the DB
-        result = conn.execute(
-            text("SELECT IndicatorId FROM indicator_metadata WHERE Name = :name AND Timeframe = :timeframe"),
-            {"name": indicator_name, "timeframe": timeframe}
-        )
-        indicator_id = result.fetchone()[0]
-
-        rows_inserted = 0
-        for _, row in values.iterrows():
-            # Determine which column holds the value (e.g. 'value' or 'rsi')
-            value_col = 'value' if 'value' in row.index else 'rsi'
-            val = row[value_col]
-            if pd.isna(val):
-                continue
-
-            bar_id = f"{row['timestamp_start'].strftime('%Y%m%d%H%M')}_SPX"
-            conn.execute(insert_stmt, {
-                "bar_id": bar_id,
-                "timeframe": timeframe,
-                "indicator_id": indicator_id,
-                "value": float(val),
-                "timestamp_start": row['timestamp_start']
-            })
-            rows_inserted += 1
+        # Fetch the numeric IndicatorId from the DB (once per indicator/timeframe)
+        indicator_id = _indicator_ids.get((indicator_name, timeframe))
+        if indicator_id is None:
+            result = conn.execute(
+                _SELECT_INDICATOR_ID,
+                {"name": indicator_name, "timeframe": timeframe}
+            )
+            indicator_id = result.fetchone()[0]
+            _indicator_ids[(indicator_name, timeframe)] = indicator_id
+
+        # Normalize timestamps once for the whole frame: UTC, tz-naive (datetime2 has no
+        # offset). Stays datetime64 until sliced into chunks below.
+        ts = pd.to_datetime(values['timestamp_start'])
+        if ts.dt.tz is not None:
+            ts = ts.dt.tz_convert('UTC').dt.tz_localize(None)
+        vals = values[value_col].to_numpy(dtype='float64')
+
+        # executemany in fixed-size chunks instead of one round trip per row. The Python
+        # datetimes handed to pyodbc, the BarId strings and the parameter dicts are built
+        # per chunk, so per-row Python objects stay O(INSERT_BATCH_SIZE) on top of the
+        # frame's own columns
+        rows_inserted = len(values)
+        for i in range(0, rows_inserted, INSERT_BATCH_SIZE):
+            ts_chunk = ts.iloc[i:i + INSERT_BATCH_SIZE]
+            starts = ts_chunk.to_numpy(dtype='datetime64[us]').astype(object)
+            bar_ids = ts_chunk.dt.strftime('%Y%m%d%H%M') + '_SPX'
+            params = [
+                {
+                    "bar_id": bar_id,
+                    "timeframe": timeframe,
+                    "indicator_id": indicator_id,
+                    "value": val,
+                    "timestamp_start": start
+                }
+                for start, val, bar_id in zip(starts, vals[i:i + INSERT_BATCH_SIZE], bar_ids)
+            ]
+            conn.execute(_INSERT_INDICATOR_VALUE, params)
 
     print(f"[{thread_name}] {indicator_name} on {timeframe} | {day} | Inserted {rows_inserted} rows.")
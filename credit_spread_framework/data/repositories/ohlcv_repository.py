@@ -2,44 +2,61 @@ from credit_spread_framework.data.db_engine import get_engine
 import pandas as pd
 from sqlalchemy import text
 
+# Correct mapping based on your confirmed schema
+TABLE_MAP = {
+    "1m": "spx_ohlcv_1m",
+    "3m": "spx_ohlcv_3m",
+    "15m": "spx_ohlcv_15m",
+    "1h": "spx_ohlcv_1h",
+    "1d": "spx_ohlcv_1d",
+}
+
+# One compiled TextClause per timeframe, built on first use
+_QUERY_CACHE = {}
+
+# Rows pulled per fetchmany when reading bars; bounds the raw tuple buffer on open-ended ranges
+READ_CHUNK_SIZE = 50_000
+
+def _get_bars_query(timeframe):
+    query = _QUERY_CACHE.get(timeframe)
+    if query is None:
+        query = text(f"""
+            SELECT 
+                bar_id, 
+                timestamp, 
+                [close] as close_price, 
+                spy_volume 
+            FROM dbo.{TABLE_MAP[timeframe]}
+            WHERE (:start IS NULL OR timestamp >= :start)
+            AND (:end IS NULL OR timestamp <= :end)
+            ORDER BY timestamp
+        """)
+        _QUERY_CACHE[timeframe] = query
+    return query
+
 def load_bars_from_db(timeframe, start=None, end=None):
+    if timeframe not in TABLE_MAP:
+        raise ValueError(f"Unsupported timeframe: {timeframe}. Must be one of {list(TABLE_MAP.keys())}")
+
     engine = get_engine()
+    table_name = TABLE_MAP[timeframe]
 
-    # Correct mapping based on your confirmed schema
-    table_map = {
-        "1m": "spx_ohlcv_1m",
-        "3m": "spx_ohlcv_3m",
-        "15m": "spx_ohlcv_15m",
-        "1h": "spx_ohlcv_1h",
-        "1d": "spx_ohlcv_1d",
-    }
-
-    if timeframe not in table_map:
-        raise ValueError(f"Unsupported timeframe: {timeframe}. Must be one of {list(table_map.keys())}")
-
-    table_name = table_map[timeframe]
-
-    query = f"""
-        SELECT 
-            bar_id, 
-            timestamp, 
-            [close] as close_price, 
-            spy_volume 
-        FROM dbo.{table_name}
-        WHERE (:start IS NULL OR timestamp >= :start)
-        AND (:end IS NULL OR timestamp <= :end)
-        ORDER BY timestamp
-    """
-
-    with engine.begin() as conn:
-        result = conn.execute(
-            text(query),
-            {
+    # Fetch in READ_CHUNK_SIZE batches converted to typed frames, so at most one batch is
+    # held as Python tuples at a time (an unbounded 1m range can run to millions of bars).
+    # The concatenated frame still holds the full result.
+    with engine.connect() as conn:
+        chunks = pd.read_sql_query(
+            _get_bars_query(timeframe),
+            conn,
+            params={
                 "start": start,
                 "end": end
-            }
+            },
+            parse_dates=["timestamp"],
+            dtype={"bar_id": "object", "close_price": "float64", "spy_volume": "float64"},
+            chunksize=READ_CHUNK_SIZE
         )
-        df = pd.DataFrame(result.fetchall(), columns=["bar_id", "timestamp", "close_price", "spy_volume"])
+        df = pd.concat(chunks, ignore_index=True)
 
     if df.empty:
         print(f"[WARNING] No bars found in {table_name} for the selected range.")
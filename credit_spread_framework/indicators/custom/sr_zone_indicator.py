@@ -23,6 +23,6 @@ class SRZoneIndicator(BaseIndicator):
                 "touch_count": [5, 3]
             })
             zones["qualifier"] = method
-            zones["parameters_json"] = zones.apply(lambda row: f'{{"touch_count": {row["touch_count"]}}}', axis=1)
+            zones["parameters_json"] = '{"touch_count": ' + zones["touch_count"].astype(str) + '}'
             all_results.append(zones.rename(columns={"zone_level": "value", "timestamp_start": "timestamp_start"}))
         return pd.concat(all_results, ignore_index=True)
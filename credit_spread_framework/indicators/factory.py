@@ -2,6 +2,10 @@ import importlib
 from credit_spread_framework.data.db_engine import get_engine
 from sqlalchemy import text
 
+# Statements are built once at import rather than on every lookup
+_SELECT_INDICATOR_BY_SHORT_NAME = text("SELECT * FROM indicators WHERE ShortName = :sn AND IsActive = 1")
+_SELECT_ACTIVE_INDICATORS = text("SELECT * FROM indicators WHERE IsActive = 1")
+
 
 def get_indicator_class(short_name: str):
     """
@@ -9,9 +13,9 @@ def get_indicator_class(short_name: str):
     Returns: (indicator_class, metadata_dict)
     """
     engine = get_engine()
-    with engine.begin() as conn:
+    with engine.connect() as conn:
         result = conn.execute(
-            text("SELECT * FROM indicators WHERE ShortName = :sn AND IsActive = 1"),
+            _SELECT_INDICATOR_BY_SHORT_NAME,
             {"sn": short_name}
         ).mappings().fetchone()
 
@@ -39,10 +43,8 @@ def get_all_indicator_classes():
     Returns: { ShortName: (indicator_class, metadata_dict) }
     """
     engine = get_engine()
-    with engine.begin() as conn:
-        results = conn.execute(
-            text("SELECT * FROM indicators WHERE IsActive = 1")
-        ).mappings().fetchall()
+    with engine.connect() as conn:
+        results = conn.execute(_SELECT_ACTIVE_INDICATORS).mappings().fetchall()
 
     indicator_classes = {}
 
@@ -1,49 +1,32 @@
-import sqlalchemy
-from sqlalchemy import create_engine, text
 import pandas as pd
-import urllib
 
-from credit_spread_framework.config.settings import SQLSERVER_CONN_STRING
+from credit_spread_framework.data.db_engine import get_engine
 
 def export_schema(output_path="schema_export.md"):
-    # Prepare the connection string
-    conn_str = urllib.parse.quote_plus(SQLSERVER_CONN_STRING)
-    engine = create_engine(f"mssql+pyodbc:///?odbc_connect={conn_str}")
-
-    # Queries to retrieve table and column information
-    query_tables = """
-        SELECT TABLE_SCHEMA, TABLE_NAME
-        FROM INFORMATION_SCHEMA.TABLES
-        WHERE TABLE_TYPE = 'BASE TABLE'
-        ORDER BY TABLE_SCHEMA, TABLE_NAME
-    """
+    engine = get_engine()
 
+    # Single query retrieving every base table together with its columns
     query_columns = """
-        SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE
-        FROM INFORMATION_SCHEMA.COLUMNS
-        ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+        SELECT c.TABLE_SCHEMA, c.TABLE_NAME, c.COLUMN_NAME, c.DATA_TYPE, c.IS_NULLABLE
+        FROM INFORMATION_SCHEMA.COLUMNS c
+        JOIN INFORMATION_SCHEMA.TABLES t
+          ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+        WHERE t.TABLE_TYPE = 'BASE TABLE'
+        ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION
     """
 
-    # Execute the queries and fetch data into pandas DataFrames
-    with engine.begin() as conn:
-        tables = pd.read_sql(query_tables, conn)
+    # Execute the query and fetch data into a pandas DataFrame
+    with engine.connect() as conn:
         columns = pd.read_sql(query_columns, conn)
 
     # Write the schema to a Markdown file
     with open(output_path, "w", encoding="utf-8") as f:
         f.write("# Database Schema Export\n\n")
-        for _, table_row in tables.iterrows():
-            schema, table = table_row["TABLE_SCHEMA"], table_row["TABLE_NAME"]
+        for (schema, table), table_columns in columns.groupby(["TABLE_SCHEMA", "TABLE_NAME"], sort=False):
             f.write(f"## `{schema}.{table}`\n\n")
             f.write("| Column Name     | Data Type    | Nullable |\n")
             f.write("|-----------------|--------------|----------|\n")
-            table_columns = columns[
-                (columns["TABLE_SCHEMA"] == schema) & (columns["TABLE_NAME"] == table)
-            ]
-            for _, col_row in table_columns.iterrows():
-                col_name = col_row["COLUMN_NAME"]
-                data_type = col_row["DATA_TYPE"]
-                nullable = col_row["IS_NULLABLE"]
+            for col_name, data_type, nullable in table_columns[["COLUMN_NAME", "DATA_TYPE", "IS_NULLABLE"]].itertuples(index=False):
                 f.write(f"| {col_name}         | {data_type}      | {nullable}    |\n")
             f.write("\n")
 
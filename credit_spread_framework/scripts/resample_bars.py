@@ -7,7 +7,9 @@ from sqlalchemy import text
 from sqlalchemy.types import String, Float, DateTime
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from data.db_engine import engine
+from credit_spread_framework.data.db_engine import get_engine
+
+engine = get_engine()
 
 # ----------------------------
 # Configure logging
@@ -51,9 +53,12 @@ INTERVAL_MAP = {
     "1d": 1440
 }
 
+# Rows removed per DELETE statement; each batch commits on its own to keep the log small
+DELETE_BATCH_SIZE = 5000
+
 def get_full_range():
     query = text("SELECT MIN(timestamp) as [start], MAX(timestamp) as [end] FROM spx_ohlcv_1m")
-    with engine.begin() as conn:
+    with engine.connect() as conn:
         result = conn.execute(query).fetchone()
         logger.info(f"1m data range: {result.start} to {result.end}")
         return pd.to_datetime(result.start).tz_localize("UTC"), pd.to_datetime(result.end).tz_localize("UTC")
@@ -64,9 +69,13 @@ def load_raw_data(start, end):
         WHERE timestamp BETWEEN :start AND :end
         ORDER BY timestamp ASC
     """)
-    with engine.begin() as conn:
-        df = pd.read_sql(query, conn, params={"start": start, "end": end})
-    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    with engine.connect() as conn:
+        df = pd.read_sql_query(
+            query,
+            conn,
+            params={"start": start, "end": end},
+            parse_dates={"timestamp": {"utc": True}}
+        )
     logger.info(f"Loaded {len(df)} 1m bars.")
     return df
 
@@ -86,23 +95,28 @@ def resample_bars(df, rule):
 
 def delete_existing_data(table_name, start, end, interval):
     logger.info(f"Deleting aligned bars from {table_name} for {interval}-minute intervals between {start} and {end}...")
-    delete_sql = f"""
-    WITH aligned_times AS (
-        SELECT DISTINCT 
-            DATEADD(MINUTE, (DATEDIFF(MINUTE, 0, timestamp) / :interval) * :interval, 0) AS aligned_timestamp
-        FROM dbo.spx_ohlcv_1m
-        WHERE timestamp BETWEEN :start AND :end
-    )
-    DELETE t
-    FROM dbo.[{table_name}] t
-    JOIN aligned_times a
-      ON t.timestamp = a.aligned_timestamp;
-    """
-    with engine.begin() as conn:
-        conn.execute(
-            text(delete_sql),
-            {"interval": interval, "start": start, "end": end}
-        )
+    # Resampled bars are stamped at the start of their bucket, so every bar built from
+    # 1m data in [start, end] lies in [floor(start), end]. A plain range predicate on
+    # the target table lets SQL Server seek on timestamp instead of re-scanning the
+    # 1m table to compute aligned buckets.
+    aligned_start = start.floor(f"{interval}min")
+    delete_sql = text(f"""
+    DELETE TOP ({DELETE_BATCH_SIZE}) FROM dbo.[{table_name}]
+    WHERE timestamp >= :start AND timestamp <= :end;
+    """)
+    total_deleted = 0
+    while True:
+        with engine.begin() as conn:
+            deleted = conn.execute(delete_sql, {"start": aligned_start, "end": end}).rowcount
+        if deleted < 0:
+            # Without a rowcount there is no telling whether bars remain; inserting on top
+            # of them would duplicate bars, so stop this timeframe instead
+            raise RuntimeError(f"Driver returned no rowcount while deleting from {table_name}; "
+                               f"{total_deleted} bars deleted before stopping.")
+        total_deleted += deleted
+        if deleted < DELETE_BATCH_SIZE:
+            break
+    logger.info(f"Deleted {total_deleted} existing bars from {table_name}.")
 
 def insert_to_db(table_name, df):
     dtypes = {
@@ -0,0 +1,103 @@
+import threading
+from concurrent.futures import Future
+import pandas as pd
+import pytest
+from credit_spread_framework.cli import enrich_data as enrich
+
+class DummyIndicator:
+    def __init__(self, parameters_json=None, qualifier=None):
+        pass
+
+    def calculate(self, bars):
+        return pd.DataFrame({'timestamp_start': bars['timestamp'], 'value': bars['close_price']})
+
+def _bars(timeframe, start, end):
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=3, freq='1min'),
+        'close_price': [4300.0, 4301.0, 4302.0]
+    })
+
+def _done(result=None, exception=None):
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+@pytest.fixture
+def stub_enrich(monkeypatch):
+    monkeypatch.setattr(enrich, "get_all_indicator_classes", lambda: {
+        "A": (DummyIndicator, {"IndicatorId": 1}),
+        "B": (DummyIndicator, {"IndicatorId": 2}),
+    })
+
+def _run(timeframes):
+    enrich.enrich_data(indicator=["A", "B"], timeframe=timeframes, start=None, end=None, threads=2, qualifier=None)
+
+def test_drain_saves_drops_finished_and_keeps_pending():
+    finished, pending = _done(), Future()
+    saves = {finished: ("A", "1m"), pending: ("B", "1m")}
+
+    assert list(enrich._drain_saves(saves, 1)) == [pending]
+
+def test_drain_saves_raises_failed_save():
+    saves = {_done(exception=RuntimeError("save failed")): ("A", "1m")}
+
+    with pytest.raises(RuntimeError, match="save failed"):
+        enrich._drain_saves(saves, 1)
+
+def test_drain_saves_blocks_until_under_limit():
+    pending = Future()
+    threading.Timer(0.05, pending.set_result, args=(None,)).start()
+
+    assert enrich._drain_saves({pending: ("A", "1m")}, 0) == {}
+
+def test_enrich_data_saves_every_indicator_and_timeframe(monkeypatch, stub_enrich):
+    saved = []
+    monkeypatch.setattr(enrich, "load_bars_from_db", _bars)
+    monkeypatch.setattr(enrich, "save_indicator_values_to_db",
+                        lambda values, ind, tf, metadata: saved.append((ind, tf, len(values))))
+
+    _run(["1m", "1h"])
+
+    assert sorted(saved) == [("A", "1h", 3), ("A", "1m", 3), ("B", "1h", 3), ("B", "1m", 3)]
+
+def test_enrich_data_stops_when_a_timeframe_fails_to_load(monkeypatch, stub_enrich):
+    loaded, saved = [], []
+
+    def load(timeframe, start, end):
+        loaded.append(timeframe)
+        if timeframe == "15m":
+            raise ValueError("Unsupported timeframe")
+        return _bars(timeframe, start, end)
+
+    monkeypatch.setattr(enrich, "load_bars_from_db", load)
+    monkeypatch.setattr(enrich, "save_indicator_values_to_db",
+                        lambda values, ind, tf, metadata: saved.append((ind, tf)))
+
+    with pytest.raises(ValueError, match="Unsupported timeframe"):
+        _run(["1m", "15m", "1h"])
+
+    # Nothing past the failing timeframe is loaded or saved
+    assert loaded == ["1m", "15m"]
+    assert sorted(saved) == [("A", "1m"), ("B", "1m")]
+
+def test_enrich_data_raises_failed_save(monkeypatch, stub_enrich):
+    loaded = []
+
+    def load(timeframe, start, end):
+        loaded.append(timeframe)
+        return _bars(timeframe, start, end)
+
+    def save(values, ind, tf, metadata):
+        raise RuntimeError("lost connection")
+
+    monkeypatch.setattr(enrich, "load_bars_from_db", load)
+    monkeypatch.setattr(enrich, "save_indicator_values_to_db", save)
+
+    with pytest.raises(RuntimeError, match="lost connection"):
+        _run(["1m", "3m", "15m", "1h", "1d"])
+
+    # The write failure stops the run before every timeframe is processed
+    assert len(loaded) < 5
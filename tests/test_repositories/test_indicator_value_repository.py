@@ -1,4 +1,5 @@
 import pandas as pd
+from datetime import datetime
 from credit_spread_framework.data.repositories.indicator_value_repository import save_indicator_values_to_db
 
 def test_save_indicator_values_to_db_mock(monkeypatch):
@@ -28,3 +29,146 @@ def test_save_indicator_values_to_db_mock(monkeypatch):
 
     # Run the function (this should now pass without exceptions)
     save_indicator_values_to_db(dummy_data, 'RSI', '15m')
+
+def test_save_indicator_values_to_db_batches_inserts(monkeypatch):
+    executed = []
+
+    class DummyResult:
+        def fetchone(self):
+            return (7,)
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            executed.append(params)
+            return DummyResult()
+        def begin(self):
+            return self
+        def __enter__(self): return self
+        def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+    dummy_data = pd.DataFrame({
+        'timestamp_start': pd.date_range(start='2024-01-01', periods=5, freq='15min'),
+        'rsi': [50, 55, None, 60, 65]
+    })
+
+    monkeypatch.setattr(
+        "credit_spread_framework.data.repositories.indicator_value_repository.create_engine",
+        lambda _: DummyConn()
+    )
+    monkeypatch.setattr(
+        "credit_spread_framework.data.repositories.indicator_value_repository._indicator_ids",
+        {}
+    )
+
+    save_indicator_values_to_db(dummy_data, 'RSI', '15m')
+
+    # One IndicatorId lookup followed by a single executemany for the non-NaN rows
+    assert len(executed) == 2
+    rows = executed[1]
+    assert isinstance(rows, list)
+    assert [r["value"] for r in rows] == [50.0, 55.0, 60.0, 65.0]
+    assert rows[0]["bar_id"] == "202401010000_SPX"
+    assert type(rows[0]["timestamp_start"]) is datetime
+    assert all(r["indicator_id"] == 7 and r["timeframe"] == "15m" for r in rows)
+
+    # A second save for the same indicator/timeframe reuses the cached IndicatorId
+    executed.clear()
+    save_indicator_values_to_db(dummy_data, 'RSI', '15m')
+    assert len(executed) == 1
+
+def test_save_indicator_values_to_db_chunks_large_frames(monkeypatch):
+    executed = []
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            executed.append(params)
+        def begin(self):
+            return self
+        def __enter__(self): return self
+        def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+    dummy_data = pd.DataFrame({
+        'timestamp_start': pd.date_range(start='2024-01-01', periods=5, freq='15min'),
+        'rsi': [50, 55, None, 60, 65]
+    })
+
+    monkeypatch.setattr(
+        "credit_spread_framework.data.repositories.indicator_value_repository.create_engine",
+        lambda _: DummyConn()
+    )
+    monkeypatch.setattr(
+        "credit_spread_framework.data.repositories.indicator_value_repository._indicator_ids",
+        {('RSI', '15m'): 7}
+    )
+    monkeypatch.setattr(
+        "credit_spread_framework.data.repositories.indicator_value_repository.INSERT_BATCH_SIZE",
+        3
+    )
+
+    save_indicator_values_to_db(dummy_data, 'RSI', '15m')
+
+    # Frames larger than INSERT_BATCH_SIZE are sent as several executemany chunks
+    assert [len(chunk) for chunk in executed] == [3, 1]
+    assert [r["value"] for chunk in executed for r in chunk] == [50.0, 55.0, 60.0, 65.0]
+    assert [r["bar_id"] for chunk in executed for r in chunk] == [
+        "202401010000_SPX", "202401010015_SPX", "202401010045_SPX", "202401010100_SPX"
+    ]
+
+def test_save_indicator_values_to_db_skips_when_all_nan(monkeypatch):
+    def fail_engine(_):
+        raise AssertionError("no connection should be opened when there is nothing to save")
+
+    monkeypatch.setattr(
+        "credit_spread_framework.data.repositories.indicator_value_repository.create_engine",
+        fail_engine
+    )
+
+    dummy_data = pd.DataFrame({
+        'timestamp_start': pd.date_range(start='2024-01-01', periods=3, freq='15min'),
+        'rsi': [None, None, None]
+    })
+
+    save_indicator_values_to_db(dummy_data, 'RSI', '15m')
+
+def test_save_indicator_values_to_db_looks_up_id_per_timeframe(monkeypatch):
+    executed = []
+    ids = {"1m": 3, "1h": 4}
+
+    class DummyResult:
+        def __init__(self, indicator_id):
+            self.indicator_id = indicator_id
+        def fetchone(self):
+            return (self.indicator_id,)
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            executed.append(params)
+            return DummyResult(ids.get(params.get("timeframe")) if isinstance(params, dict) else None)
+        def begin(self):
+            return self
+        def __enter__(self): return self
+        def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+    dummy_data = pd.DataFrame({
+        'timestamp_start': pd.date_range(start='2024-01-01', periods=2, freq='1min'),
+        'rsi': [50, 55]
+    })
+
+    monkeypatch.setattr(
+        "credit_spread_framework.data.repositories.indicator_value_repository.create_engine",
+        lambda _: DummyConn()
+    )
+    monkeypatch.setattr(
+        "credit_spread_framework.data.repositories.indicator_value_repository._indicator_ids",
+        {}
+    )
+
+    # Caller metadata (the indicators row) doesn't override the per-timeframe IndicatorId
+    metadata = {"IndicatorId": 99, "ShortName": "RSI"}
+    save_indicator_values_to_db(dummy_data, 'RSI', '1m', metadata)
+    save_indicator_values_to_db(dummy_data, 'RSI', '1h', metadata)
+
+    lookups = [p for p in executed if isinstance(p, dict)]
+    inserts = [p for p in executed if isinstance(p, list)]
+    assert [p["timeframe"] for p in lookups] == ["1m", "1h"]
+    assert [{r["indicator_id"] for r in rows} for rows in inserts] == [{3}, {4}]